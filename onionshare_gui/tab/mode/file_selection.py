@@ -213,9 +213,8 @@ class FileList(QtWidgets.QListWidget):
         if event.mimeData().hasUrls:
             event.setDropAction(QtCore.Qt.CopyAction)
             event.accept()
-            for url in event.mimeData().urls():
-                filename = str(url.toLocalFile())
-                self.add_file(filename)
+            filenames = [str(url.toLocalFile()) for url in event.mimeData().urls()]
+            self.add_filenames(filenames)
         else:
             event.ignore()
 
@@ -306,6 +305,29 @@ class FileList(QtWidgets.QListWidget):
 
             self.files_updated.emit()
 
+    def add_filenames(self, filenames):
+        """
+        Add several files or directories to this widget at once. The list is
+        only sorted, redrawn and updated once, after all of them are added.
+        """
+        count = self.count()
+
+        self.setUpdatesEnabled(False)
+        self.setSortingEnabled(False)
+        self.blockSignals(True)
+        try:
+            for filename in filenames:
+                self.add_file(filename)
+        finally:
+            self.blockSignals(False)
+            # Re-enabling sorting doesn't re-sort the list, so sort it here
+            self.setSortingEnabled(True)
+            self.sortItems()
+            self.setUpdatesEnabled(True)
+
+        if self.count() != count:
+            self.files_updated.emit()
+
 
 class FileSelection(QtWidgets.QVBoxLayout):
     """
@@ -392,8 +414,7 @@ class FileSelection(QtWidgets.QVBoxLayout):
         """
         file_dialog = AddFileDialog(self.common, caption=strings._("gui_choose_items"))
         if file_dialog.exec_() == QtWidgets.QDialog.Accepted:
-            for filename in file_dialog.selectedFiles():
-                self.file_list.add_file(filename)
+            self.file_list.add_filenames(file_dialog.selectedFiles())
 
         self.file_list.setCurrentItem(None)
         self.update()
@@ -406,8 +427,7 @@ class FileSelection(QtWidgets.QVBoxLayout):
             self.parent, caption=strings._("gui_choose_items")
         )
         filenames = files[0]
-        for filename in filenames:
-            self.file_list.add_file(filename)
+        self.file_list.add_filenames(filenames)
 
     def add_folder(self):
         """
@@ -70,8 +70,7 @@ class ShareMode(Mode):
         # File selection
         self.file_selection = FileSelection(self.common, self)
         if self.filenames:
-            for filename in self.filenames:
-                self.file_selection.file_list.add_file(filename)
+            self.file_selection.file_list.add_filenames(self.filenames)
 
         # Server status
         self.server_status.set_mode("share", self.file_selection)
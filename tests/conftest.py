@@ -7,11 +7,20 @@ sys.onionshare_dev_mode = True
 sys.onionshare_test_mode = True
 
 import os
+
+# Render the GUI tests offscreen, unless a Qt platform was chosen explicitly
+# (for example, QT_QPA_PLATFORM=xcb to watch the windows)
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
 import shutil
 import tempfile
 
 import pytest
 
+# pytest only exports MonkeyPatch from 6.2 on, so it can't be used with the
+# locked pytest 5.4
+from _pytest.monkeypatch import MonkeyPatch
+
 from onionshare import common, web, settings, strings
 
 
@@ -206,3 +215,121 @@ def settings_obj(sys_onionshare_dev_mode, platform_linux):
     _common.version = "DUMMY_VERSION_1.2.3"
     strings.load_strings(_common)
     return settings.Settings(_common)
+
+
+@pytest.fixture(scope="session")
+def gui_common():
+    """The Common object shared by every GUI test in the session"""
+    return common.Common(verbose=True)
+
+
+@pytest.fixture(scope="session")
+def qapp(gui_common):
+    """
+    The OnionShare QApplication. This overrides pytest-qt's qapp fixture, so
+    that qtbot and the GUI tests share the same application.
+    """
+    from onionshare_gui import Application
+
+    return Application(gui_common)
+
+
+@pytest.fixture(scope="module")
+def gui(gui_common, qapp, tmp_path_factory):
+    """
+    The MainWindow shared by all of the GUI tests in a module. Each module gets
+    its own empty home directory, so its settings file and persistent tabs
+    start out clean and can't leak into the next module.
+    """
+    from PyQt5 import QtCore
+    from onionshare_gui import MainWindow, GuiCommon
+
+    # The data dir is built from the home directory (APPDATA on Windows)
+    mp = MonkeyPatch()
+    home_dir = str(tmp_path_factory.mktemp("home"))
+    mp.setenv("HOME", home_dir)
+    mp.setenv("USERPROFILE", home_dir)
+    mp.setenv("APPDATA", home_dir)
+
+    try:
+        gui_common.gui = GuiCommon(gui_common, qapp, local_only=True)
+        gui = MainWindow(gui_common, filenames=None)
+        gui.qtapp = qapp
+        yield gui
+
+        # Quit
+        qapp.clipboard().clear()
+        QtCore.QTimer.singleShot(0, gui.close_dialog.accept_button.click)
+        gui.close()
+
+        gui.cleanup()
+    finally:
+        mp.undo()
+
+
+@pytest.fixture(scope="module")
+def gui_tmpdir():
+    """Creates a temporary directory with some files for the GUI tests to use"""
+    tmpdir = tempfile.TemporaryDirectory()
+
+    # Create some random files to test with. The file list is sorted by name,
+    # and the share tests expect these to come before "test.txt"
+    for i in range(10):
+        with open(os.path.join(tmpdir.name, f"random_{i}.txt"), "wb") as file:
+            file.write(os.urandom(20))
+
+    # A file called "test.txt"
+    with open(os.path.join(tmpdir.name, "test.txt"), "w") as file:
+        file.write("onionshare")
+
+    # A file called "test2.txt"
+    with open(os.path.join(tmpdir.name, "test2.txt"), "w") as file:
+        file.write("onionshare2")
+
+    # A file called "index.html"
+    with open(os.path.join(tmpdir.name, "index.html"), "w") as file:
+        file.write(
+            "<html><body><p>This is a test website hosted by OnionShare</p></body></html>"
+        )
+
+    yield tmpdir
+
+    tmpdir.cleanup()
+
+
+@pytest.fixture(scope="module")
+def tmpfiles(gui_tmpdir):
+    """The random files in the GUI tests' temporary directory"""
+    return [os.path.join(gui_tmpdir.name, f"random_{i}.txt") for i in range(10)]
+
+
+@pytest.fixture(scope="class")
+def gui_test_class(request, gui, gui_tmpdir, tmpfiles):
+    """
+    Set up a unittest-style GUI test class with the shared MainWindow and the
+    files to test with
+    """
+    cls = request.cls
+    cls.gui = gui
+    cls.tmpdir = gui_tmpdir
+    cls.tmpfiles = tmpfiles
+    cls.tmpfile_test = os.path.join(gui_tmpdir.name, "test.txt")
+    cls.tmpfile_test2 = os.path.join(gui_tmpdir.name, "test2.txt")
+    cls.tmpfile_index_html = os.path.join(gui_tmpdir.name, "index.html")
+
+
+@pytest.fixture
+def gui_large_file(request, gui_test_class):
+    """
+    Create a large file (155 MB) for the GUI tests that need one. This is
+    only written for the tests that use it, rather than for every test class.
+    """
+    cls = request.cls
+    size = 1024 * 1024 * 155
+    cls.tmpfile_large = os.path.join(cls.tmpdir.name, "large_file")
+    with open(cls.tmpfile_large, "wb") as fout:
+        fout.write(os.urandom(size))
+
+    yield
+
+    os.remove(cls.tmpfile_large)
@@ -1,160 +1,130 @@
 import pytest
 import unittest
 
-import json
-import os
 import requests
-import shutil
-import base64
-import tempfile
-import secrets
 
-from PyQt5 import QtCore, QtTest, QtWidgets
+from PyQt5 import QtCore, QtTest
 
 from onionshare import strings
-from onionshare.common import Common
-from onionshare.settings import Settings
-from onionshare.onion import Onion
-from onionshare.web import Web
 
-from onionshare_gui import Application, MainWindow, GuiCommon
 from onionshare_gui.tab.mode.share_mode import ShareMode
 from onionshare_gui.tab.mode.receive_mode import ReceiveMode
 from onionshare_gui.tab.mode.website_mode import WebsiteMode
 
+# Shared test functions. GuiBaseTest wraps these for the unittest-style tests,
+# and the plain pytest tests call them directly
 
-class GuiBaseTest(unittest.TestCase):
-    @classmethod
-    def setUpClass(cls):
-        common = Common(verbose=True)
-
-        # Delete any old test data that might exist
-        shutil.rmtree(common.build_data_dir(), ignore_errors=True)
-
-        qtapp = Application(common)
-        common.gui = GuiCommon(common, qtapp, local_only=True)
-        cls.gui = MainWindow(common, filenames=None)
-        cls.gui.qtapp = qtapp
-
-        # Create some random files to test with
-        cls.tmpdir = tempfile.TemporaryDirectory()
-        cls.tmpfiles = []
-        for _ in range(10):
-            filename = os.path.join(cls.tmpdir.name, f"{secrets.token_hex(4)}.txt")
-            with open(filename, "w") as file:
-                file.write(secrets.token_hex(10))
-            cls.tmpfiles.append(filename)
-
-        # A file called "test.txt"
-        cls.tmpfile_test = os.path.join(cls.tmpdir.name, "test.txt")
-        with open(cls.tmpfile_test, "w") as file:
-            file.write("onionshare")
-
-        # A file called "test2.txt"
-        cls.tmpfile_test2 = os.path.join(cls.tmpdir.name, "test2.txt")
-        with open(cls.tmpfile_test2, "w") as file:
-            file.write("onionshare2")
-
-        # A file called "index.html"
-        cls.tmpfile_index_html = os.path.join(cls.tmpdir.name, "index.html")
-        with open(cls.tmpfile_index_html, "w") as file:
-            file.write(
-                "<html><body><p>This is a test website hosted by OnionShare</p></body></html>"
-            )
 
-        # A large file
-        size = 1024 * 1024 * 155
-        cls.tmpfile_large = os.path.join(cls.tmpdir.name, "large_file")
-        with open(cls.tmpfile_large, "wb") as fout:
-            fout.write(os.urandom(size))
+def verify_new_tab(qtbot, tab):
+    # Process any pending events, then make sure the new tab widget is showing,
+    # and no mode has been started
+    qtbot.wait(0)
+    assert tab.new_tab.isVisible()
+    assert not {"share_mode", "receive_mode", "website_mode"} & tab.__dict__.keys()
 
-    @classmethod
-    def tearDownClass(cls):
-        # Quit
-        cls.gui.qtapp.clipboard().clear()
-        QtCore.QTimer.singleShot(200, cls.gui.close_dialog.accept_button.click)
-        cls.gui.close()
 
-        cls.gui.cleanup()
+def new_share_tab(gui, qtbot):
+    tab = gui.tabs.widget(0)
+    verify_new_tab(qtbot, tab)
 
-    # Shared test methods
+    # Share files
+    tab.share_button.click()
+    assert not tab.new_tab.isVisible()
+    assert tab.share_mode.isVisible()
 
-    def verify_new_tab(self, tab):
-        # Make sure the new tab widget is showing, and no mode has been started
-        QtTest.QTest.qWait(1000)
-        self.assertTrue(tab.new_tab.isVisible())
-        self.assertFalse(hasattr(tab, "share_mode"))
-        self.assertFalse(hasattr(tab, "receive_mode"))
-        self.assertFalse(hasattr(tab, "website_mode"))
+    return tab
 
-    def new_share_tab(self):
-        tab = self.gui.tabs.widget(0)
-        self.verify_new_tab(tab)
 
-        # Share files
-        tab.share_button.click()
-        self.assertFalse(tab.new_tab.isVisible())
-        self.assertTrue(tab.share_mode.isVisible())
+def new_share_tab_with_files(gui, qtbot, tmpfiles):
+    tab = new_share_tab(gui, qtbot)
 
-        return tab
+    # Add files
+    tab.share_mode.server_status.file_selection.file_list.add_filenames(tmpfiles)
+    qtbot.wait(0)
 
-    def new_share_tab_with_files(self):
-        tab = self.new_share_tab()
+    return tab
 
-        # Add files
-        for filename in self.tmpfiles:
-            tab.share_mode.server_status.file_selection.file_list.add_file(filename)
 
-        return tab
+def new_receive_tab(gui, qtbot):
+    tab = gui.tabs.widget(0)
+    verify_new_tab(qtbot, tab)
 
-    def new_receive_tab(self):
-        tab = self.gui.tabs.widget(0)
-        self.verify_new_tab(tab)
+    # Receive files
+    tab.receive_button.click()
+    assert not tab.new_tab.isVisible()
+    assert tab.receive_mode.isVisible()
 
-        # Receive files
-        tab.receive_button.click()
-        self.assertFalse(tab.new_tab.isVisible())
-        self.assertTrue(tab.receive_mode.isVisible())
+    return tab
 
-        return tab
 
-    def new_website_tab(self):
-        tab = self.gui.tabs.widget(0)
-        self.verify_new_tab(tab)
+def new_website_tab(gui, qtbot):
+    tab = gui.tabs.widget(0)
+    verify_new_tab(qtbot, tab)
 
-        # Publish website
-        tab.website_button.click()
-        self.assertFalse(tab.new_tab.isVisible())
-        self.assertTrue(tab.website_mode.isVisible())
+    # Publish website
+    tab.website_button.click()
+    assert not tab.new_tab.isVisible()
+    assert tab.website_mode.isVisible()
 
-        return tab
+    return tab
 
-    def new_website_tab_with_files(self):
-        tab = self.new_website_tab()
 
-        # Add files
-        for filename in self.tmpfiles:
-            tab.website_mode.server_status.file_selection.file_list.add_file(filename)
+def new_website_tab_with_files(gui, qtbot, tmpfiles):
+    tab = new_website_tab(gui, qtbot)
 
-        return tab
+    # Add files
+    tab.website_mode.server_status.file_selection.file_list.add_filenames(tmpfiles)
+    qtbot.wait(0)
+
+    return tab
+
+
+def run_all_common_setup_tests(gui):
+    """
+    Test that the GUI is shown, with the right window title and a visible status
+    bar
+    """
+    # The GUI actually is shown
+    assert gui.show
+
+    # The window title is OnionShare
+    assert gui.windowTitle() == "OnionShare"
+
+    # The status bar is visible
+    assert gui.status_bar.isVisible()
 
-    def close_all_tabs(self):
-        for _ in range(self.gui.tabs.count()):
-            tab = self.gui.tabs.widget(0)
-            QtCore.QTimer.singleShot(200, tab.close_dialog.accept_button.click)
-            self.gui.tabs.tabBar().tabButton(0, QtWidgets.QTabBar.RightSide).click()
 
-    def gui_loaded(self):
-        """Test that the GUI actually is shown"""
-        self.assertTrue(self.gui.show)
+@pytest.mark.usefixtures("gui_test_class")
+class GuiBaseTest(unittest.TestCase):
+    @pytest.fixture(autouse=True)
+    def set_qtbot(self, qtbot):
+        self.qtbot = qtbot
 
-    def window_title_seen(self):
-        """Test that the window title is OnionShare"""
-        self.assertEqual(self.gui.windowTitle(), "OnionShare")
+    # Shared test methods
 
-    def server_status_bar_is_visible(self):
-        """Test that the status bar is visible"""
-        self.assertTrue(self.gui.status_bar.isVisible())
+    def verify_new_tab(self, tab):
+        verify_new_tab(self.qtbot, tab)
+
+    def new_share_tab(self):
+        return new_share_tab(self.gui, self.qtbot)
+
+    def new_share_tab_with_files(self):
+        return new_share_tab_with_files(self.gui, self.qtbot, self.tmpfiles)
+
+    def new_receive_tab(self):
+        return new_receive_tab(self.gui, self.qtbot)
+
+    def new_website_tab(self):
+        return new_website_tab(self.gui, self.qtbot)
+
+    def new_website_tab_with_files(self):
+        return new_website_tab_with_files(self.gui, self.qtbot, self.tmpfiles)
+
+    def close_all_tabs(self):
+        for _ in range(self.gui.tabs.count()):
+            tab = self.gui.tabs.widget(0)
+            QtCore.QTimer.singleShot(0, tab.close_dialog.accept_button.click)
+            self.gui.tabs.close_tab(0)
 
     def mode_settings_widget_is_visible(self, tab):
         """Test that the mode settings are visible"""
@@ -437,6 +407,4 @@ class GuiBaseTest(unittest.TestCase):
     # Grouped tests follow from here
 
     def run_all_common_setup_tests(self):
-        self.gui_loaded()
-        self.window_title_seen()
-        self.server_status_bar_is_visible()
+        run_all_common_setup_tests(self.gui)
@@ -2,8 +2,9 @@
 
 # The script runs python tests
 # Firstly, all CLI tests are run
-# Then, all the GUI tests are run individually
-# to avoid segmentation fault
+# Then, all the GUI tests are run in parallel with pytest-xdist. Each worker
+# is its own process with its own QApplication, and --dist=loadfile keeps
+# all of the tests in a file (which share a MainWindow) in the same worker
 
 PARAMS=""
 
@@ -21,6 +22,4 @@ do
 done
 
 pytest $PARAMS -vvv ./tests/test_cli*.py || exit 1
-for filename in ./tests/test_gui_*.py; do
-	pytest $PARAMS -vvv --no-qt-log $filename || exit 1
-done
+pytest $PARAMS -vvv --no-qt-log -n auto --dist=loadfile ./tests/test_gui_*.py || exit 1
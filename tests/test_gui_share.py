@@ -413,6 +413,36 @@ class TestShare(GuiBaseTest):
 
         self.close_all_tabs()
 
+    @pytest.mark.gui
+    def test_add_filenames(self):
+        """
+        Adding several files at once should sort them by name, and only tell the
+        rest of the GUI that the file list changed once
+        """
+        tab = self.new_share_tab()
+        file_list = tab.get_mode().server_status.file_selection.file_list
+
+        updates = []
+        file_list.files_updated.connect(lambda: updates.append(True))
+
+        file_list.add_filenames([self.tmpfiles[2], self.tmpfiles[0], self.tmpfiles[1]])
+        self.assertEqual(
+            [file_list.item(i).basename for i in range(file_list.count())],
+            ["random_0.txt", "random_1.txt", "random_2.txt"],
+        )
+        self.assertEqual(len(updates), 1)
+
+        # The file list's signals and updates should be turned back on
+        self.assertFalse(file_list.signalsBlocked())
+        self.assertTrue(file_list.updatesEnabled())
+
+        # Adding files that are already in the list shouldn't change anything
+        file_list.add_filenames([self.tmpfiles[0], self.tmpfiles[1]])
+        self.assertEqual(file_list.count(), 3)
+        self.assertEqual(len(updates), 1)
+
+        self.close_all_tabs()
+
     @pytest.mark.gui
     def test_public_mode(self):
         """
@@ -477,6 +507,7 @@ class TestShare(GuiBaseTest):
         self.close_all_tabs()
 
     @pytest.mark.gui
+    @pytest.mark.usefixtures("gui_large_file")
     def test_large_download(self):
         """
         Test a large download
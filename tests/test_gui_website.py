@@ -52,8 +52,9 @@ class TestWebsite(GuiBaseTest):
         tab.get_mode().server_status.file_selection.file_list.add_file(
             self.tmpfile_index_html
         )
-        for filename in self.tmpfiles:
-            tab.get_mode().server_status.file_selection.file_list.add_file(filename)
+        tab.get_mode().server_status.file_selection.file_list.add_filenames(
+            self.tmpfiles
+        )
 
         self.file_selection_widget_has_files(tab, 11)
         self.history_is_not_visible(tab)